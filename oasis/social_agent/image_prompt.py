@@ -5,6 +5,7 @@ This module provides the base system prompt and utilities for generating
 high-quality social media image prompts that produce realistic, authentic-looking
 photos suitable for Facebook/Instagram feeds.
 """
+from functools import lru_cache
 
 # Base system prompt prepended to all image generation requests
 # Designed to produce Instagram/Facebook-quality photos
@@ -32,12 +33,23 @@ DO NOT include:
 """
 
 
+# Prefix built once at import so each call does a single concatenation
+# instead of re-copying the ~700-char system prompt through an f-string.
+_PROMPT_PREFIX = IMAGE_SYSTEM_PROMPT + "\n\nSubject: "
+
+# UTF-8 encoding of the prefix, for callers that hand bytes straight to an
+# HTTP client: the constant portion of every prompt is encoded exactly once.
+IMAGE_SYSTEM_PROMPT_BYTES = _PROMPT_PREFIX.encode("utf-8")
+
+
+@lru_cache(maxsize=2048)
 def build_image_prompt(user_prompt: str) -> str:
     """
     Combine the system prompt style guidance with a user's image description.
 
     This function prepends the IMAGE_SYSTEM_PROMPT to ensure consistent,
     high-quality social media photo generation across all image requests.
+    Results are memoized since many agents issue identical descriptions.
 
     Args:
         user_prompt: The agent's description of what they want in the image
@@ -51,5 +63,23 @@ def build_image_prompt(user_prompt: str) -> str:
         >>> prompt = build_image_prompt("Sunset over the ocean with waves")
         >>> # Returns IMAGE_SYSTEM_PROMPT + "\\n\\nSubject: Sunset over the ocean with waves"
     """
-    return f"{IMAGE_SYSTEM_PROMPT}\n\nSubject: {user_prompt}"
+    return _PROMPT_PREFIX + user_prompt
+
+
+def build_image_prompt_bytes(user_prompt: str) -> bytes:
+    """
+    Build a full image prompt as UTF-8 bytes.
+
+    Same result as `build_image_prompt(user_prompt).encode("utf-8")`, but the
+    constant style-guidance prefix is pre-encoded at import, so only the
+    user's description is encoded per call. Useful when the downstream API
+    client accepts bytes and would otherwise re-encode the whole prompt.
+
+    Args:
+        user_prompt: The agent's description of what they want in the image.
+
+    Returns:
+        UTF-8 encoded full prompt.
+    """
+    return IMAGE_SYSTEM_PROMPT_BYTES + user_prompt.encode("utf-8")
 
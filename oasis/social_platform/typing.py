@@ -11,10 +11,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # =========== Copyright 2023 @ CAMEL-AI.org. All Rights Reserved. ===========
+import sys
 from enum import Enum
 
 
-class ActionType(Enum):
+class ActionType(str, Enum):
     EXIT = "exit"
     REFRESH = "refresh"
     SEARCH_USER = "search_user"
@@ -62,48 +63,72 @@ class ActionType(Enum):
 
     @classmethod
     def get_default_twitter_actions(cls):
-        return [
-            cls.CREATE_POST,
-            cls.LIKE_POST,
-            cls.REPOST,
-            cls.FOLLOW,
-            cls.DO_NOTHING,
-            cls.QUOTE_POST,
-        ]
+        return _DEFAULT_TWITTER_ACTIONS
 
     @classmethod
     def get_default_reddit_actions(cls):
-        return [
-            cls.LIKE_POST,
-            cls.DISLIKE_POST,
-            cls.CREATE_POST,
-            cls.CREATE_COMMENT,
-            cls.LIKE_COMMENT,
-            cls.DISLIKE_COMMENT,
-            cls.SEARCH_POSTS,
-            cls.SEARCH_USER,
-            cls.TREND,
-            cls.REFRESH,
-            cls.DO_NOTHING,
-            cls.FOLLOW,
-            cls.MUTE,
-        ]
+        return _DEFAULT_REDDIT_ACTIONS
 
     @classmethod
     def get_default_facebook_actions(cls):
         """Get default actions for Facebook-style platform."""
-        return [
-            cls.CREATE_POST,
-            cls.CREATE_GROUP_POST,
-            cls.REACT_TO_POST,
-            cls.SEND_FRIEND_REQUEST,
-            cls.ACCEPT_FRIEND_REQUEST,
-            cls.CREATE_COMMENT,
-            cls.JOIN_GROUP,
-            cls.SHARE_TO_GROUP,
-            cls.REFRESH,
-            cls.DO_NOTHING,
-        ]
+        return _DEFAULT_FACEBOOK_ACTIONS
+
+
+# Intern the action value strings so equal action strings arriving from any
+# code path share one PyUnicode object: hashes are computed once and cached,
+# and dict lookups keyed by action values hit the pointer-compare fast path.
+for _member in ActionType:
+    _member._value_ = sys.intern(_member._value_)
+del _member
+
+
+# Default action sets per platform, built once at import. frozensets give
+# O(1) `in` checks on action dispatch instead of scanning a freshly built
+# list on every call; callers that iterate still work.
+_DEFAULT_TWITTER_ACTIONS = frozenset({
+    ActionType.CREATE_POST,
+    ActionType.LIKE_POST,
+    ActionType.REPOST,
+    ActionType.FOLLOW,
+    ActionType.DO_NOTHING,
+    ActionType.QUOTE_POST,
+})
+
+_DEFAULT_REDDIT_ACTIONS = frozenset({
+    ActionType.LIKE_POST,
+    ActionType.DISLIKE_POST,
+    ActionType.CREATE_POST,
+    ActionType.CREATE_COMMENT,
+    ActionType.LIKE_COMMENT,
+    ActionType.DISLIKE_COMMENT,
+    ActionType.SEARCH_POSTS,
+    ActionType.SEARCH_USER,
+    ActionType.TREND,
+    ActionType.REFRESH,
+    ActionType.DO_NOTHING,
+    ActionType.FOLLOW,
+    ActionType.MUTE,
+})
+
+_DEFAULT_FACEBOOK_ACTIONS = frozenset({
+    ActionType.CREATE_POST,
+    ActionType.CREATE_GROUP_POST,
+    ActionType.REACT_TO_POST,
+    ActionType.SEND_FRIEND_REQUEST,
+    ActionType.ACCEPT_FRIEND_REQUEST,
+    ActionType.CREATE_COMMENT,
+    ActionType.JOIN_GROUP,
+    ActionType.SHARE_TO_GROUP,
+    ActionType.REFRESH,
+    ActionType.DO_NOTHING,
+})
+
+
+# Stable small-integer ids for action hints, keyed by ActionType value.
+# Used for deterministic event seeding (e.g. VirtualClock) so hot paths can
+# mix a small int instead of re-hashing the action string on every event.
+ACTION_HINT_ID = {action.value: i for i, action in enumerate(ActionType)}
 
 
 class RecsysType(Enum):
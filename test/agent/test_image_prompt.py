@@ -0,0 +1,27 @@
+# =========== Copyright 2023 @ CAMEL-AI.org. All Rights Reserved. ===========
+# Licensed under the Apache License, Version 2.0 (the “License”);
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an “AS IS” BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =========== Copyright 2023 @ CAMEL-AI.org. All Rights Reserved. ===========
+from oasis.social_agent.image_prompt import (IMAGE_SYSTEM_PROMPT,
+                                             build_image_prompt,
+                                             build_image_prompt_bytes)
+
+
+def test_build_image_prompt_prepends_system_prompt():
+    prompt = build_image_prompt("A homemade pasta dish")
+    assert prompt == f"{IMAGE_SYSTEM_PROMPT}\n\nSubject: A homemade pasta dish"
+
+
+def test_build_image_prompt_bytes_matches_str_builder():
+    user_prompt = "Crème brûlée by candlelight 🍮"
+    assert (build_image_prompt_bytes(user_prompt)
+            == build_image_prompt(user_prompt).encode("utf-8"))
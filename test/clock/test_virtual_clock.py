@@ -0,0 +1,256 @@
+# =========== Copyright 2023 @ CAMEL-AI.org. All Rights Reserved. ===========
+# Licensed under the Apache License, Version 2.0 (the “License”);
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an “AS IS” BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =========== Copyright 2023 @ CAMEL-AI.org. All Rights Reserved. ===========
+import builtins
+import importlib.util
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from oasis.clock import virtual_clock
+from oasis.clock.virtual_clock import VirtualClock
+from oasis.social_platform.typing import ACTION_HINT_ID, ActionType
+
+
+def test_event_time_within_tick_range():
+    clock = VirtualClock(tick_duration_s=86400, seed=42)
+    for agent_id in range(50):
+        assert 0 <= clock.event_time(agent_id=agent_id) <= 86399
+    clock.advance_tick()
+    for agent_id in range(50):
+        assert 86400 <= clock.event_time(agent_id=agent_id) <= 172799
+
+
+def test_event_time_unique_per_agent_within_tick():
+    # Independent events go through a full-period permutation of the tick
+    # range, so one agent's timestamps cover the range without repeats.
+    duration = 60
+    clock = VirtualClock(tick_duration_s=duration, seed=7)
+    times = [clock.event_time(agent_id=3) for _ in range(duration)]
+    assert sorted(times) == list(range(duration))
+
+
+def test_event_time_causality():
+    clock = VirtualClock(seed=42)
+    post_time = clock.event_time(agent_id=1, action_hint="create_post")
+    comment_time = clock.event_time(agent_id=2, parent_time=post_time,
+                                    action_hint="create_comment")
+    assert comment_time > post_time
+
+
+def test_event_time_accepts_action_type_hint():
+    # ActionType is a str subclass and must be usable wherever a hint string
+    # is, producing the same timestamp as its value.
+    t_enum = VirtualClock(seed=3).event_time(
+        agent_id=1, parent_time=5, action_hint=ActionType.CREATE_COMMENT)
+    t_str = VirtualClock(seed=3).event_time(
+        agent_id=1, parent_time=5, action_hint="create_comment")
+    assert t_enum == t_str
+
+
+def test_event_time_tick_edge_spill():
+    clock = VirtualClock(tick_duration_s=86400, seed=42)
+    # Parent at (or past) the end of the tick spills just past the parent.
+    assert clock.event_time(agent_id=1, parent_time=86399) == 86400
+    assert clock.event_time(agent_id=1, parent_time=90000) == 90001
+
+
+def test_event_time_spill_does_not_consume_event_index():
+    spilled = VirtualClock(seed=42)
+    plain = VirtualClock(seed=42)
+    assert spilled.event_time(agent_id=1) == plain.event_time(agent_id=1)
+    spilled.event_time(agent_id=1, parent_time=86399)
+    assert spilled.event_time(agent_id=1) == plain.event_time(agent_id=1)
+
+
+def test_event_time_deterministic_across_instances():
+    clock_a = VirtualClock(seed=42)
+    clock_b = VirtualClock(seed=42)
+    for agent_id in (1, 2, 1, 5):
+        assert (clock_a.event_time(agent_id=agent_id)
+                == clock_b.event_time(agent_id=agent_id))
+    parent = clock_a.event_time(agent_id=9)
+    clock_b.event_time(agent_id=9)
+    assert (clock_a.event_time(agent_id=3, parent_time=parent,
+                               action_hint="create_comment")
+            == clock_b.event_time(agent_id=3, parent_time=parent,
+                                  action_hint="create_comment"))
+
+
+def test_event_time_array_counters_match_dict_counters():
+    # n_agents switches counter storage; timestamps must not change.
+    array_clock = VirtualClock(seed=42, n_agents=10)
+    dict_clock = VirtualClock(seed=42)
+    for _ in range(3):
+        for agent_id in range(10):
+            assert (array_clock.event_time(agent_id=agent_id)
+                    == dict_clock.event_time(agent_id=agent_id))
+        array_clock.advance_tick()
+        dict_clock.advance_tick()
+
+
+def test_enforce_unique_within_tick():
+    clock = VirtualClock(tick_duration_s=10, seed=1,
+                         enforce_unique_within_tick=True)
+    times = [clock.event_time(agent_id=0, parent_time=3) for _ in range(6)]
+    assert all(4 <= t <= 9 for t in times)
+    assert len(set(times)) == 6
+
+
+def test_event_times_matches_scalar():
+    batch_clock = VirtualClock(seed=42)
+    scalar_clock = VirtualClock(seed=42)
+    agent_ids = np.array([1, 2, 1, 3, 2, 1, 7], dtype=np.int64)
+    batch = batch_clock.event_times(agent_ids)
+    scalar = [scalar_clock.event_time(agent_id=int(a)) for a in agent_ids]
+    assert list(batch) == scalar
+
+
+def test_event_times_constrained_matches_scalar():
+    batch_clock = VirtualClock(seed=7)
+    scalar_clock = VirtualClock(seed=7)
+    hint = "create_comment"
+    hint_id = ACTION_HINT_ID[hint]
+    parents = np.array([100, 5000, 86398], dtype=np.int64)
+    agent_ids = np.array([1, 2, 3], dtype=np.int64)
+    batch = batch_clock.event_times(
+        agent_ids, parents, np.full(3, hint_id, dtype=np.int64))
+    scalar = [
+        scalar_clock.event_time(agent_id=int(a), parent_time=int(p),
+                                action_hint=hint)
+        for a, p in zip(agent_ids, parents)
+    ]
+    assert list(batch) == scalar
+
+
+def test_event_times_tick_edge_spill():
+    clock = VirtualClock(seed=7)
+    out = clock.event_times(np.array([1, 2], dtype=np.int64),
+                            np.array([86399, 90000], dtype=np.int64))
+    assert list(out) == [86400, 90001]
+
+
+def test_event_times_counter_continuity_with_scalar():
+    # Scalar and batched calls draw from the same per-agent counters, with
+    # and without the n_agents array storage.
+    for n_agents in (0, 10):
+        mixed = VirtualClock(seed=9, n_agents=n_agents)
+        scalar_only = VirtualClock(seed=9, n_agents=n_agents)
+        first = mixed.event_time(agent_id=1)
+        assert first == scalar_only.event_time(agent_id=1)
+        agent_ids = np.array([1, 1, 2], dtype=np.int64)
+        batch = mixed.event_times(agent_ids)
+        expected = [scalar_only.event_time(agent_id=int(a)) for a in agent_ids]
+        assert list(batch) == expected
+        assert mixed.event_time(agent_id=1) == scalar_only.event_time(agent_id=1)
+
+
+def test_event_times_spill_rows_do_not_consume_event_index():
+    # A spill row in a batch must not advance the agent's counter (the
+    # scalar path returns before any bookkeeping), or every later timestamp
+    # for that agent diverges between batched and scalar generation.
+    mixed = VirtualClock(seed=9)
+    scalar_only = VirtualClock(seed=9)
+    agent_ids = np.array([1, 1, 2], dtype=np.int64)
+    parents = np.array([-1, 86399, -1], dtype=np.int64)
+    batch = mixed.event_times(agent_ids, parents)
+    expected = [
+        scalar_only.event_time(agent_id=1),
+        scalar_only.event_time(agent_id=1, parent_time=86399),
+        scalar_only.event_time(agent_id=2),
+    ]
+    assert list(batch) == expected
+    assert batch[1] == 86400
+    # Counters agree afterwards, for both scalar and batched follow-ups.
+    assert mixed.event_time(agent_id=1) == scalar_only.event_time(agent_id=1)
+    follow = mixed.event_times(np.array([1, 2], dtype=np.int64))
+    assert list(follow) == [scalar_only.event_time(agent_id=1),
+                            scalar_only.event_time(agent_id=2)]
+    # An all-spill batch advances nothing.
+    all_spill = mixed.event_times(np.array([3, 3], dtype=np.int64),
+                                  np.array([90000, 100000], dtype=np.int64))
+    assert list(all_spill) == [90001, 100001]
+    assert mixed.event_time(agent_id=3) == scalar_only.event_time(agent_id=3)
+
+
+def _load_clock_module_without_numba():
+    """Load a fresh copy of the clock module with the numba import blocked."""
+    real_import = builtins.__import__
+
+    def blocked_import(name, *args, **kwargs):
+        if name.split(".")[0] == "numba":
+            raise ImportError("numba disabled for fallback test")
+        return real_import(name, *args, **kwargs)
+
+    spec = importlib.util.spec_from_file_location("_virtual_clock_no_numba",
+                                                  virtual_clock.__file__)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    builtins.__import__ = blocked_import
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        builtins.__import__ = real_import
+        sys.modules.pop(spec.name, None)
+    return module
+
+
+def test_event_times_fallback_without_numba():
+    fallback_module = _load_clock_module_without_numba()
+    assert not fallback_module._HAS_NUMBA
+    agent_ids = np.array([1, 2, 1, 3], dtype=np.int64)
+    parents = np.array([-1, 100, -1, 86399], dtype=np.int64)
+    hint_ids = np.array([0, ACTION_HINT_ID["create_comment"], 0, 0],
+                        dtype=np.int64)
+    expected = VirtualClock(seed=7).event_times(agent_ids, parents, hint_ids)
+    fallback = fallback_module.VirtualClock(seed=7).event_times(
+        agent_ids, parents, hint_ids)
+    assert list(fallback) == list(expected)
+
+
+def test_to_datetime_matches_timedelta_arithmetic():
+    clock = VirtualClock(seed=1)
+    rng = random.Random(0)
+    for _ in range(200):
+        seconds = rng.randrange(0, 10 * 365 * 86400)
+        assert (clock.to_datetime(seconds)
+                == clock.epoch + timedelta(seconds=seconds))
+
+
+def test_to_iso_strings_matches_scalar():
+    clock = VirtualClock(seed=1)
+    rng = random.Random(1)
+    times = np.array([rng.randrange(0, 10 * 365 * 86400) for _ in range(200)],
+                     dtype=np.int64)
+    for seconds, iso in zip(times, clock.to_iso_strings(times)):
+        assert iso == clock.to_iso_string(int(seconds))
+
+
+def test_to_iso_strings_matches_scalar_for_aware_epoch():
+    for tz in (timezone.utc, timezone(timedelta(hours=5))):
+        clock = VirtualClock(epoch=datetime(2024, 1, 1, tzinfo=tz))
+        times = np.array([0, 100, 86400, 10_000_000], dtype=np.int64)
+        for seconds, iso in zip(times, clock.to_iso_strings(times)):
+            assert iso == clock.to_iso_string(int(seconds))
+
+
+def test_reset_restores_initial_state():
+    clock = VirtualClock(seed=42)
+    first = clock.event_time(agent_id=1, action_hint="create_post")
+    clock.advance_tick(3)
+    clock.event_time(agent_id=1)
+    clock.reset()
+    assert clock.tick == 0
+    assert clock.event_time(agent_id=1, action_hint="create_post") == first